@@ -0,0 +1,148 @@
+import curses
+import time
+
+from neptune.Stars import Stars
+
+
+class Dashboard(object):
+    """
+    Terminal view of per-star risk by hour that is refreshed in place.  Each
+    cell's text is cached and only cells whose text has changed are written,
+    so between universe updates a refresh usually only rewrites the timers.
+    """
+    NAME_WIDTH = 24
+    CELL_WIDTH = 6
+    STATUS_ROW = 2
+    HOURS_ROW = 3
+    HEADER_ROWS = 4
+
+    def __init__(self, screen, max_hours=24):
+        self.screen = screen
+        self.max_hours = max_hours
+        self.cells = {}
+        self.rows = []
+        self.offset = 0
+        self.universe = None
+        self.player = None
+        self.pending_orders = 0
+        self.status = ""
+
+        try:
+            curses.curs_set(0)
+        except curses.error:
+            pass
+
+    def set_universe(self, universe):
+        """
+        Recalculate the risk table from a newly fetched universe
+        """
+        self.universe = universe
+        self.player = universe.player()
+        player_stars = universe.stars.stars_for_player(self.player)
+        self.pending_orders = universe.fleets.fleets_for_player(self.player).pending_orders()
+
+        ranges = player_stars.ships_in_range(self.max_hours)
+        self.rows = [(name, [Stars.risk(ships[hour]) for hour in range(1, self.max_hours + 1)])
+                     for name, ships in sorted(ranges.items())]
+
+    def set_status(self, status):
+        """
+        Set the message shown below the header, such as a failed update
+        """
+        self.status = status
+
+    def reset(self):
+        """
+        Forget the cached cells and redraw everything on the next draw()
+        """
+        self.cells = {}
+        self.screen.clear()
+
+    @staticmethod
+    def format_time(seconds):
+        seconds = int(max(seconds, 0))
+        hours, seconds = divmod(seconds, 3600)
+        minutes, seconds = divmod(seconds, 60)
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+
+    def put(self, row, col, text, width, attr=curses.A_NORMAL):
+        """
+        Write text padded or truncated to width at a position if it differs
+        from what is already there
+        """
+        text = f"{text:<{width}}"[:width]
+        key = (row, col)
+        if self.cells.get(key) == (text, attr):
+            return
+        self.cells[key] = (text, attr)
+        try:
+            self.screen.addstr(row, col, text, attr)
+        except curses.error:
+            # Text beyond the edge of the screen
+            pass
+
+    def draw(self, next_update):
+        """
+        Update the screen
+        :param next_update: Time the universe will next be fetched
+        """
+        height, width = self.screen.getmaxyx()
+        columns = max((width - self.NAME_WIDTH - 2) // self.CELL_WIDTH, 0)
+        columns = min(columns, self.max_hours)
+        now = time.time()
+
+        self.put(0, 0, self.player['name'], self.NAME_WIDTH, curses.A_BOLD)
+        self.put(0, self.NAME_WIDTH, f" Cash: ${self.universe.cash()}", 16)
+        self.put(0, self.NAME_WIDTH + 16, f" Tick in: {self.format_time(self.universe.tick_time - now):>9}", 20)
+        self.put(1, self.NAME_WIDTH, f" Orders: {self.pending_orders}", 16)
+        self.put(1, self.NAME_WIDTH + 16, f" Update in: {self.format_time(next_update - now):>7}", 20)
+
+        self.put(self.STATUS_ROW, 0, self.status, max(width - 1, 0), curses.A_BOLD)
+
+        self.put(self.HOURS_ROW, 0, f"{'Risk - hours':>{self.NAME_WIDTH}}: ", self.NAME_WIDTH + 2, curses.A_UNDERLINE)
+        for column in range(columns):
+            self.put(self.HOURS_ROW, self.NAME_WIDTH + 2 + column * self.CELL_WIDTH,
+                     column + 1, self.CELL_WIDTH, curses.A_UNDERLINE)
+
+        visible = max(height - self.HEADER_ROWS, 0)
+        self.offset = max(min(self.offset, len(self.rows) - visible), 0)
+        for line in range(visible):
+            row = self.HEADER_ROWS + line
+            index = self.offset + line
+            if index < len(self.rows):
+                name, risks = self.rows[index]
+                self.put(row, 0, f"{name[:self.NAME_WIDTH]:>{self.NAME_WIDTH}}: ", self.NAME_WIDTH + 2)
+                for column in range(columns):
+                    risk = risks[column]
+                    self.put(row, self.NAME_WIDTH + 2 + column * self.CELL_WIDTH,
+                             risk, self.CELL_WIDTH,
+                             curses.A_REVERSE if risk else curses.A_NORMAL)
+            else:
+                self.put(row, 0, "", self.NAME_WIDTH + 2)
+                for column in range(columns):
+                    self.put(row, self.NAME_WIDTH + 2 + column * self.CELL_WIDTH,
+                             "", self.CELL_WIDTH)
+
+        self.screen.refresh()
+
+    def wait(self, refresh):
+        """
+        Wait up to refresh seconds for a key press and handle it
+        :return: False if the user asked to quit
+        """
+        self.screen.timeout(int(refresh * 1000))
+        key = self.screen.getch()
+        page = max(self.screen.getmaxyx()[0] - self.HEADER_ROWS, 1)
+        if key in (ord('q'), ord('Q')):
+            return False
+        elif key in (curses.KEY_UP, ord('k')):
+            self.offset -= 1
+        elif key in (curses.KEY_DOWN, ord('j')):
+            self.offset += 1
+        elif key == curses.KEY_PPAGE:
+            self.offset -= page
+        elif key == curses.KEY_NPAGE:
+            self.offset += page
+        elif key == curses.KEY_RESIZE:
+            self.reset()
+        return True
@@ -33,6 +33,8 @@ class Fleet(object):
         self.loc_x = float(info['lx'])
         self.loc_y = float(info['ly'])
         self.ships = int(info['st'])
+        # Pending orders: [delay, star ID, action, argument]
+        self.orders = info.get('o', [])
 
     def __str__(self):
         return f"{self.name:>20}: id:{self.id:<3} ships:{self.ships:<5} player:{self.player_id}"
\ No newline at end of file
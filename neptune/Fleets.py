@@ -15,6 +15,16 @@ class Fleets(object):
         fleets = Fleets(sorted(fleet_array, key=lambda i: i.id), universe)
         return fleets
 
+    def fleets_for_player(self, player):
+        return Fleets([fleet for fleet in self.fleets if fleet.player_id == player['id']],
+                      self.universe)
+
+    def pending_orders(self):
+        """
+        :return: Total number of orders queued across the fleets
+        """
+        return sum(len(fleet.orders) for fleet in self.fleets)
+
     def __str__(self):
         return '\n'.join([str(s) for s in self.fleets])
 
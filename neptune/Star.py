@@ -1,6 +1,5 @@
 
 import math
-import requests
 from neptune.Player import Player
 
 # Star format:
@@ -97,10 +96,9 @@ class Star(object):
                 'game_number': '%d' % self.universe.state["game_id"]}
         print("Star.upgrade(): command: %s" % data)
 
-        result = requests.post(
+        result = self.universe.state.post(
             'https://np.ironhelmet.com/prequest/batched_orders',
-            data=data,
-            cookies=self.universe.state["cookies"])
+            data=data)
         print('Star.upgrade(): status=%d text=%s' % (
             result.status_code, result.text))
         if result.status_code != 200:
@@ -136,4 +134,34 @@ class Star(object):
                 player = players.by_id(fleet.player_id)
                 counts[player['state']] += fleet.ships
 
-        return counts
\ No newline at end of file
+        return counts
+
+    def ships_in_range_by_hour(self, stars, fleets, players, max_hours):
+        """
+        Count ships in range for every hour up to max_hours.  Equivalent to
+        calling ships_in_range() for each hour, but only measures the distance
+        to each star and fleet once.
+        :return: {hours: {player state: ships}}
+        """
+        arrivals = {hours: {Player.SELF: 0,
+                            Player.FRIEND: 0,
+                            Player.NEUTRAL: 0,
+                            Player.FOE: 0} for hours in range(1, max_hours + 1)}
+        for star in stars:
+            if star.visible:
+                hours = max(self.distance_to(star)['time'], 1)
+                if hours <= max_hours:
+                    player = players.by_id(star.player_id)
+                    arrivals[hours][player['state']] += star.ships
+        for fleet in fleets:
+            hours = max(self.distance_to(fleet)['time'], 1)
+            if hours <= max_hours:
+                player = players.by_id(fleet.player_id)
+                arrivals[hours][player['state']] += fleet.ships
+
+        # Ships arriving within an hour are also in range for all later hours
+        for hours in range(2, max_hours + 1):
+            for state, ships in arrivals[hours - 1].items():
+                arrivals[hours][state] += ships
+
+        return arrivals
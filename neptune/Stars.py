@@ -1,3 +1,4 @@
+from neptune.Player import Player
 from neptune.Star import Star
 
 
@@ -82,17 +83,22 @@ class Stars(object):
 
         return resource, star, cost
 
-    def ships_in_range(self):
+    def ships_in_range(self, max_hours=24):
         result = {}
-        for hours in range(1, 25):
-            for star in self.stars:
-                ships = star.ships_in_range(self, self.universe.fleets,
-                                            self.universe.players, hours)
-                if star.name not in result:
-                    result[star.name] = {}
-                result[star.name][hours] = ships
+        for star in self.stars:
+            result[star.name] = star.ships_in_range_by_hour(
+                self, self.universe.fleets, self.universe.players, max_hours)
         return result
 
+    @staticmethod
+    def risk(ships):
+        """
+        :param ships: Ship counts by player state, from ships_in_range()
+        :return: Enemy ships in excess of our own, 0 if none
+        """
+        risk = ships[Player.FOE] - ships[Player.SELF]
+        return risk if risk > 0 else 0
+
     def __iter__(self):
         return iter(self.stars)
 
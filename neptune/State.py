@@ -1,52 +1,210 @@
-import pickle
+import json
+import os
+import sys
+import tempfile
+import threading
+
 import requests
 
 
 class State(dict):
     CREDENTIALS = "creds.np"
+    LOGIN_URL = 'https://np.ironhelmet.com/arequest/login'
+    # Cookie holding the session, only set by a successful login
+    SESSION_COOKIE = 'auth'
+
+    # Response status codes and report strings that mean the session expired
+    AUTH_FAILURE_CODES = (401, 403)
+    AUTH_FAILURE_REPORTS = ('must_be_logged_in',)
 
-    def __init__(self, game_id, cookies):
+    def __init__(self, game_id, cookies, login=None, password=None):
         dict.__init__(self,
                       game_id=game_id,
-                      cookies=cookies)
+                      cookies=cookies,
+                      login=login)
+        # The password is only held in memory, never written to disk
+        self._password = password
+        self._credentials = None
+        self._lock = threading.Lock()
+        # Incremented on every successful login, used to collapse concurrent
+        # re-login attempts into one
+        self._generation = 0
 
     @staticmethod
     def new(login, password, credentials, game_id):
-        if login:
-            cookies = State.login(login, password)
-            state = State(game_id, cookies)
+        """
+        Reuse the session cached in the credentials file if there is one for
+        the same login, otherwise log in.  The password, when given, is kept
+        so the session can be renewed when it expires.
+        """
+        state = State.load(credentials) if os.path.isfile(credentials) else None
+        if state is not None and login and state['login'] != login:
+            print(f"Cached session in {credentials} is not for {login}")
+            state = None
+
+        if state is None:
+            if not login:
+                print(f"No usable credentials in {credentials}, log in with email/password")
+                sys.exit(1)
+            state = State(game_id, None, login)
+        elif login and game_id is not None and state['game_id'] != game_id:
+            state['game_id'] = game_id
             state.save(credentials)
-        else:
-            state = State.load(credentials)
+        state._password = password
+        state._credentials = credentials
+
+        if state['cookies'] is None and not state.relogin(state._generation):
+            print("Login failed")
+            sys.exit(1)
         return state
 
     @staticmethod
     def login(login, password):
+        """
+        :return: The session cookies, or None if the login failed
+        """
         print("Logging in with email/password")
-        cookies = requests.post(
-            'https://np.ironhelmet.com/arequest/login',
-            data={'type': 'login',
-                  'alias': login,
-                  'password': password}).cookies
-        return cookies
+        try:
+            response = requests.post(
+                State.LOGIN_URL,
+                data={'type': 'login',
+                      'alias': login,
+                      'password': password})
+        except requests.RequestException as e:
+            print(f"State.login(): request failed: {e}")
+            return None
+        if response.status_code != requests.codes.ok:
+            print(f"State.login(): failed, status={response.status_code}")
+            return None
+        if State.SESSION_COOKIE not in response.cookies:
+            print(f"State.login(): failed, no session cookie: {response.text}")
+            return None
+        return response.cookies
 
     @staticmethod
     def load(credentials):
         """
         Read state from a file
+        :return: The state, or None if the file could not be read
         """
-        with open(credentials, 'rb') as creds:
-            state = pickle.load(creds)
-            print(f"Read state from {credentials}: game_id={state['game_id']}")
-            return state
+        try:
+            with open(credentials, 'r') as creds:
+                data = json.load(creds)
+            state = State(data['game_id'],
+                          State.cookies_from_list(data['cookies']),
+                          data.get('login'))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            print(f"Unable to read {credentials}, log in with email/password to recreate it")
+            return None
+
+        print(f"Read state from {credentials}: game_id={state['game_id']}")
+        return state
 
     def save(self, credentials):
         """
-        Write state to a file
+        Atomically write state to a file readable only by the current user
         :param credentials:
         :return:
         """
-        with open(credentials, "wb") as creds:
-            pickle.dump(self, creds)
-            print("Wrote cookies to %s" % credentials)
+        data = {'game_id': self['game_id'],
+                'login': self['login'],
+                'cookies': State.cookies_to_list(self['cookies'])}
+
+        directory = os.path.dirname(os.path.abspath(credentials))
+        fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=".creds-")
+        try:
+            with os.fdopen(fd, "w") as creds:
+                json.dump(data, creds, indent=2)
+                creds.flush()
+                os.fsync(creds.fileno())
+            os.chmod(tmp_name, 0o600)
+            os.replace(tmp_name, credentials)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        print("Wrote cookies to %s" % credentials)
+
+    @staticmethod
+    def cookies_to_list(cookies):
+        """
+        :return: The cookies in a jar as a list of JSON serializable dicts
+        """
+        return [{'name': cookie.name,
+                 'value': cookie.value,
+                 'domain': cookie.domain,
+                 'path': cookie.path,
+                 'expires': cookie.expires,
+                 'secure': cookie.secure} for cookie in cookies]
+
+    @staticmethod
+    def cookies_from_list(cookie_list):
+        """
+        :return: A cookie jar built from the output of cookies_to_list()
+        """
+        cookies = requests.cookies.RequestsCookieJar()
+        for cookie in cookie_list:
+            cookies.set_cookie(requests.cookies.create_cookie(**cookie))
+        return cookies
+
+    @staticmethod
+    def is_auth_failure(response):
+        """
+        :return: True if the response indicates the session is not logged in
+        """
+        if response.status_code in State.AUTH_FAILURE_CODES:
+            return True
+        # Avoid decoding large successful replies such as the universe report
+        if not any(report.encode() in response.content for report in State.AUTH_FAILURE_REPORTS):
+            return False
+        try:
+            report = response.json().get('report')
+        except (ValueError, AttributeError):
+            return False
+        return isinstance(report, str) and report in State.AUTH_FAILURE_REPORTS
+
+    def relogin(self, generation):
+        """
+        Log in again after an auth failure.  Callers pass the generation that
+        their failed request was made with; if another thread has logged in
+        since then the new cookies are reused rather than logging in again.
+        :param generation: Value of the generation when the request was made
+        :return: True if there is a newer session to retry with
+        """
+        with self._lock:
+            if self._generation != generation:
+                return True
+            if not self['login'] or not self._password:
+                print("State.relogin(): session expired, no email/password to log in with; "
+                      "pass -l/-p for automatic recovery")
+                return False
+            cookies = State.login(self['login'], self._password)
+            if cookies is None:
+                return False
+            self['cookies'] = cookies
+            self._generation += 1
+            if self._credentials:
+                self.save(self._credentials)
+            return True
+
+    def post(self, url, data):
+        """
+        POST a request with the session cookies, logging in again and retrying
+        once if the session has expired.
+        :return: The requests response
+        """
+        generation = self._generation
+        response = requests.post(url, data=data, cookies=self['cookies'])
+        if State.is_auth_failure(response):
+            print(f"State.post(): session expired, status={response.status_code}")
+            if self.relogin(generation):
+                response = requests.post(url, data=data, cookies=self['cookies'])
+        return response
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
 
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -39,12 +39,11 @@ class Universe(object):
                 print(f"get_universe(): read universe from {Universe.UNIVERSE_FILE}")
         else:
             print("get_universe(): querying for universe")
-            response = requests.post('https://np.ironhelmet.com/trequest/order',
-                                     data={'type': 'order',
-                                           'order': 'full_universe_report',
-                                           'version': '',
-                                           'game_number': state["game_id"]},
-                                     cookies=state["cookies"])
+            response = state.post('https://np.ironhelmet.com/trequest/order',
+                                  data={'type': 'order',
+                                        'order': 'full_universe_report',
+                                        'version': '',
+                                        'game_number': state["game_id"]})
             if response.status_code != requests.codes.ok:
                 print(f"get_universe(): request failed, code {response.status_code}")
                 print("  data: %s" % response.text)
@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
 
 import argparse
+import contextlib
+import io
 import os
+import requests
 import sys
 import time
 
 from neptune.Player import Player
 from neptune.Star import Star
+from neptune.Stars import Stars
 from neptune.State import State
 from neptune.Universe import Universe
 
@@ -19,6 +23,9 @@ from multiprocessing import Process
 MONITOR_PERIOD = 15 * 60  # In seconds
 MAX_DELAY = 60
 
+# Seconds between redraws of the watch dashboard
+WATCH_REFRESH_DEFAULT = 1.0
+
 # Amount of cash to reserve from automatic upgrades
 UPGRADE_RESERVE_DEFAULT = 1000
 
@@ -26,9 +33,11 @@ UPGRADE_RESERVE_DEFAULT = 1000
 def handle_args():
     parser = argparse.ArgumentParser()
 
-    parser.add_argument("-l", "--login", help="Login ID")
+    parser.add_argument("-l", "--login", help="Login ID, needed with --password to log in again when the session expires")
     parser.add_argument("-p", "--password", help="password")
-    parser.add_argument("-C", "--credentials", default=State.CREDENTIALS, help="Cookies output file [default: %(default)s]")
+    parser.add_argument("-C", "--credentials", default=State.CREDENTIALS,
+                        help="Cookies cache file, reused when present; pass -l/-p as well to recover "
+                             "automatically from an expired session [default: %(default)s]")
     parser.add_argument("-g", "--gameid", type=int, default=5380395345117184, help="Game ID")
 
     parser.add_argument("-v", "--verbose", action="store_true")
@@ -47,8 +56,17 @@ def handle_args():
     parser.add_argument("-r", "--reserve", type=int, default=UPGRADE_RESERVE_DEFAULT,
                         help="Cash to hold back from automatic updates [default: %(default)d]")
 
+    parser.add_argument("-W", "--watch", action="store_true", help="Show a live dashboard of star risk")
+    parser.add_argument("--refresh", type=float, default=WATCH_REFRESH_DEFAULT,
+                        help="Seconds between dashboard redraws [default: %(default)s]")
+
     options = parser.parse_args()
 
+    if options.watch and options.monitor:
+        parser.error("--watch and --monitor cannot be used together")
+    if options.refresh <= 0:
+        parser.error("--refresh must be greater than 0")
+
     if (not os.path.isfile(options.credentials)) and (options.login is None or options.password is None):
         print("Must provide cookies file or login/password")
         sys.exit(1)
@@ -56,6 +74,14 @@ def handle_args():
     return options
 
 
+def next_update_time(start_time, universe):
+    """
+    :param start_time: Time the universe was last fetched
+    :return: Time at which the universe should next be fetched
+    """
+    return min(start_time + MONITOR_PERIOD, universe.tick_time + 15)
+
+
 def monitor_process(options, state):
 
     print("Launching monitor process")
@@ -89,8 +115,7 @@ def monitor_process(options, state):
 
         while True:
             now = time.time()
-            delay = MONITOR_PERIOD - (now - start_time)
-            delay = min(delay, (universe.tick_time + 15 - now))
+            delay = next_update_time(start_time, universe) - now
             if delay < 0:
                 break
             print(f"Sleeping for {delay:.0f}s, {universe.tick_time - now:.0f}s to tick")
@@ -100,6 +125,49 @@ def monitor_process(options, state):
     return
 
 
+def watch_process(screen, options, state, universe, output):
+    """
+    Display the risk dashboard, fetching the universe on the monitor schedule
+    :param output: Buffer for messages printed while fetching the universe,
+                   which would otherwise be drawn over the dashboard
+    """
+    from neptune.Dashboard import Dashboard
+
+    dashboard = Dashboard(screen)
+    dashboard.set_universe(universe)
+    next_update = next_update_time(time.time(), universe)
+
+    while True:
+        if time.time() >= next_update:
+            start_time = time.time()
+            # Only keep the messages from the latest fetch
+            output.seek(0)
+            output.truncate()
+            try:
+                with contextlib.redirect_stdout(output):
+                    universe = Universe.get_universe(False, state)
+            except (SystemExit, ValueError, requests.RequestException) as e:
+                # Keep showing the last universe and try again later
+                if isinstance(e, SystemExit):
+                    # get_universe() prints the reason before exiting
+                    lines = [line for line in output.getvalue().splitlines()
+                             if line and not line[0].isspace()]
+                    error = lines[-1] if lines else "unknown error"
+                else:
+                    error = str(e)
+                dashboard.set_status(f"Update failed at {time.strftime('%H:%M:%S')}: {error}")
+                next_update = start_time + MAX_DELAY
+                continue
+            dashboard.set_universe(universe)
+            dashboard.set_status("")
+            next_update = next_update_time(start_time, universe)
+            continue
+
+        dashboard.draw(next_update)
+        if not dashboard.wait(min(options.refresh, max(next_update - time.time(), 0))):
+            break
+
+
 def main():
     options = handle_args()
 
@@ -121,23 +189,14 @@ def main():
 
     if options.ship_counts or options.risk:
         ranges = player_stars.ships_in_range()
-        hours = ""
+        hours = next(iter(ranges.values()), {}).keys()
+        print(f"{'Ships in range - hours':>24}: " + " ".join(f"{hour:<5}" for hour in hours))
         for star, data in ranges.items():
-            txt = f"{star:>24}: "
-            for hour, ships in data.items():
-                risk = ships[Player.FOE] - ships[Player.SELF]
-                if risk < 0:
-                    risk = 0
-                if options.risk:
-                    txt += f"{risk:<5} "
-                else:
-                    txt += f"{ships[Player.FOE]:<5} "
-                if hours is not None:
-                    hours += f"{hour:<5} "
-            if hours is not None:
-                print(f"{'Ships in range - hours':>24}: {hours}")
-                hours = None
-            print(txt)
+            if options.risk:
+                counts = [Stars.risk(ships) for ships in data.values()]
+            else:
+                counts = [ships[Player.FOE] for ships in data.values()]
+            print(f"{star:>24}: " + " ".join(f"{count:<5}" for count in counts))
 
     if options.upgrade:
         player_stars.upgrade_cheapest(None, options.execute, universe.cash())
@@ -155,6 +214,17 @@ def main():
         upgrade_monitor.start()
         upgrade_monitor.join()
 
+    if options.watch:
+        import curses
+
+        # Print the messages captured from the last fetch once curses has
+        # restored the terminal
+        output = io.StringIO()
+        try:
+            curses.wrapper(watch_process, options, state, universe, output)
+        finally:
+            print(output.getvalue(), end="")
+
 
 def console_init():
     """